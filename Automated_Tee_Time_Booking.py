@@ -5,18 +5,118 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, ElementNotInteractableException
 
-import schedule
 import asyncio
 import aiohttp
 import logging
+import os
+import queue
+import atexit
 import time
 import datetime
 from datetime import date, datetime as dt
 import json
+import re
+import socket
+import ssl
+from urllib.parse import urlsplit, urlunsplit
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from contextlib import contextmanager
+from functools import partial
 import sys
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: faster event loop for timer and socket wakeups
+except ImportError:
+    uvloop = None
+
+
+# Server message meaning the window has not opened yet; matched on raw response bytes
+_NOT_OPEN = re.compile(rb"booking not open", re.IGNORECASE)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode obj as JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data):
+    """Decode JSON text or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _install_fast_event_loop():
+    """Make new event loops use uvloop when it is available"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _resolve_future(future: asyncio.Future):
+    """Timer callback that wakes a waiting attempt unless it was cancelled"""
+    if not future.done():
+        future.set_result(None)
+
+
+@contextmanager
+def _realtime_window():
+    """Pin to one CPU and raise scheduling priority while the burst is dispatched
+    
+    Linux only; falls back to os.nice(-10) without SCHED_FIFO rights and is a
+    no-op elsewhere. Yields a short description of what was applied.
+    """
+    if not sys.platform.startswith("linux"):
+        yield "unchanged"
+        return
+    
+    saved_affinity = os.sched_getaffinity(0)
+    saved_policy = os.sched_getscheduler(0)
+    saved_param = os.sched_getparam(0)
+    saved_priority = os.getpriority(os.PRIO_PROCESS, 0)
+    applied = []
+    realtime = False
+    niced = False
+    
+    try:
+        # Highest allowed CPU, which avoids CPU 0 and the interrupts it usually services
+        os.sched_setaffinity(0, {max(saved_affinity)})
+        applied.append(f"cpu{max(saved_affinity)}")
+    except OSError:
+        pass
+    
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        realtime = True
+        applied.append("SCHED_FIFO")
+    except OSError:
+        try:
+            os.nice(-10)
+            niced = True
+            applied.append("nice -10")
+        except OSError:
+            pass
+    
+    try:
+        yield ", ".join(applied) or "unchanged"
+    finally:
+        if realtime:
+            os.sched_setscheduler(0, saved_policy, saved_param)
+        if niced:
+            os.setpriority(os.PRIO_PROCESS, 0, saved_priority)
+        try:
+            os.sched_setaffinity(0, saved_affinity)
+        except OSError:
+            pass
+
 
 @dataclass
 class BurstConfig:
@@ -31,13 +131,75 @@ class BurstConfig:
     # Timing precision
     booking_window_time: str = "23:00:00"  # When bookings open
     cutoff_seconds: int = 30  # Stop trying after this many seconds
+    # Parsed booking_window_time and the string it was parsed from
+    _window_time: Optional[datetime.time] = field(default=None, init=False, repr=False, compare=False)
+    _window_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.burst_offsets is None:
             # Default burst strategy: T-70ms, T-40ms, T-10ms, T+10ms, T+40ms, T+70ms
             self.burst_offsets = [-70, -40, -10, 10, 40, 70]
+        
+        # Validate and parse at load time so a bad config fails before Chrome starts
+        if not all(isinstance(offset, int) for offset in self.burst_offsets):
+            raise ValueError(f"burst_offsets must be integers (milliseconds): {self.burst_offsets!r}")
+        self._parse_window_time()
+    
+    def _parse_window_time(self) -> datetime.time:
+        """Parse booking_window_time ("HH:MM:SS") and cache the result"""
+        hour, minute, second = map(int, self.booking_window_time.split(':'))
+        self._window_time = datetime.time(hour, minute, second)
+        self._window_source = self.booking_window_time
+        return self._window_time
+    
+    @property
+    def window_time(self) -> datetime.time:
+        """booking_window_time as a time of day, re-parsed only if the field changed"""
+        if self._window_source != self.booking_window_time:
+            return self._parse_window_time()
+        return self._window_time
+    
+    # Derived on access so later changes to burst_offsets can never leave it stale
+    @property
+    def offsets_ns(self) -> Tuple[int, ...]:
+        """burst_offsets as integer nanoseconds"""
+        return tuple(offset * 1_000_000 for offset in self.burst_offsets)
 
 @dataclass
+class AppConfig:
+    """Application settings from config.json; field defaults cover any missing keys"""
+    burst_config: BurstConfig = field(default_factory=BurstConfig)
+    credentials: Dict[str, str] = field(
+        default_factory=lambda: {"username": "USERNAME", "password": "PASSWORD"}
+    )
+    target_times: List[str] = field(default_factory=lambda: ["7:33", "7:42"])
+    days_in_advance: int = 2  # booking_settings.days_in_advance
+    run_time: str = "22:59:55"  # schedule.run_time
+    headless: bool = True  # booking_settings.headless
+    
+    @classmethod
+    def from_dict(cls, config_data: Dict) -> "AppConfig":
+        """Build settings from parsed config.json data"""
+        defaults = cls()
+        burst_fields = {f.name for f in fields(BurstConfig) if f.init}
+        burst_cfg = config_data.get('burst_config', {})
+        
+        return cls(
+            burst_config=BurstConfig(**{k: v for k, v in burst_cfg.items() if k in burst_fields}),
+            credentials=config_data.get('credentials', defaults.credentials),
+            target_times=config_data.get('target_times', defaults.target_times),
+            days_in_advance=config_data.get('booking_settings', {}).get('days_in_advance', defaults.days_in_advance),
+            run_time=config_data.get('schedule', {}).get('run_time', defaults.run_time),
+            headless=config_data.get('booking_settings', {}).get('headless', defaults.headless)
+        )
+    
+    @classmethod
+    def load(cls, config_file: str) -> "AppConfig":
+        """Read and parse a JSON configuration file"""
+        with open(config_file, 'rb') as f:
+            return cls.from_dict(_json_loads(f.read()))
+
+@dataclass(slots=True)
 class BookingAttempt:
     """Represents a single booking attempt with timing data"""
     timestamp: float
@@ -47,6 +209,8 @@ class BookingAttempt:
     success: bool = False
     error_message: Optional[str] = None
     round_trip_latency_ms: Optional[float] = None
+    # Stood down (no further requests) because another attempt already booked
+    skipped: bool = False
 
 class EnhancedLogger:
     """Enhanced logging with millisecond precision and performance tracking"""
@@ -64,15 +228,40 @@ class EnhancedLogger:
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
         
         # File handler
         file_handler = logging.FileHandler('tee_time_booking.log')
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        
+        # Callers only enqueue records; a background thread writes them out so
+        # console/file I/O never blocks the event loop during a burst
+        self._queue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+        self.listener = QueueListener(self._queue, console_handler, file_handler)
+        self.listener.start()
+        atexit.register(self.close)
+    
+    def close(self):
+        """Flush queued records and stop the background logging thread"""
+        if self.listener is None:
+            return
+        
+        self.logger.removeHandler(self._queue_handler)
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self.listener = None
+        atexit.unregister(self.close)
     
     def log_attempt(self, attempt: BookingAttempt):
         """Log a booking attempt with full timing details"""
+        if attempt.skipped:
+            self.logger.info(
+                f"Attempt at offset {attempt.offset_ms:+d}ms stood down: booking already secured by another attempt"
+            )
+            return
+        
         self.logger.info(
             f"Attempt at offset {attempt.offset_ms:+d}ms: "
             f"Status={attempt.status_code}, "
@@ -86,37 +275,69 @@ class EnhancedLogger:
     
     def log_burst_summary(self, attempts: List[BookingAttempt]):
         """Log summary of burst attempts"""
-        successful = [a for a in attempts if a.success]
-        failed = [a for a in attempts if not a.success]
-        
-        self.logger.info(f"Burst Summary: {len(successful)} successful, {len(failed)} failed")
+        # Single pass over the attempts for counts, fastest success and timing totals
+        successful_count = 0
+        skipped_count = 0
+        fastest = None
+        total_response = 0.0
+        timed_count = 0
+        
+        for attempt in attempts:
+            if attempt.success:
+                successful_count += 1
+                if fastest is None or attempt.response_time_ms < fastest.response_time_ms:
+                    fastest = attempt
+            elif attempt.skipped:
+                skipped_count += 1
+            if attempt.response_time_ms:
+                total_response += attempt.response_time_ms
+                timed_count += 1
+        
+        failed_count = len(attempts) - successful_count - skipped_count
+        self.logger.info(
+            f"Burst Summary: {successful_count} successful, {failed_count} failed, {skipped_count} stood down"
+        )
         
-        if successful:
-            fastest = min(successful, key=lambda x: x.response_time_ms)
+        if fastest is not None:
             self.logger.info(f"Fastest successful: {fastest.response_time_ms:.2f}ms at offset {fastest.offset_ms:+d}ms")
         
         # Log timing statistics
-        response_times = [a.response_time_ms for a in attempts if a.response_time_ms]
-        if response_times:
-            avg_response = sum(response_times) / len(response_times)
+        if timed_count:
+            avg_response = total_response / timed_count
             self.logger.info(f"Average response time: {avg_response:.2f}ms")
 
 
 class BurstFireTeeTimeBooker:
     """Enhanced tee time booker with burst-fire strategy and parallel execution"""
     
-    def __init__(self, config: BurstConfig, credentials: Dict[str, str], target_times: List[str] = None):
+    def __init__(self, config: BurstConfig, credentials: Dict[str, str], target_times: List[str] = None,
+                 headless: bool = True):
         self.config = config
+        self.headless = headless
         self.credentials = credentials
         self.target_times = target_times or ["7:33", "7:42"]  # High-demand slots
         self.logger = EnhancedLogger()
         self.driver = None
         self.session_cookies = None
         self.booking_url = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Event loop the session runs on, cached by initialize_session
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Pre-serialized booking payloads keyed by (date, tee_time)
+        self._payload_cache: Dict[Tuple[str, str], bytes] = {}
+        self._json_headers = {"Content-Type": "application/json"}
+        # Set by the first successful attempt so the rest of the burst stands down
+        self._success_event = asyncio.Event()
+        # One shared ticker paces every retrier instead of a timer per retry
+        self._retry_tick = asyncio.Condition()
+        self._retry_waiters = 0
+        self._tick_task: Optional[asyncio.Task] = None
+        self._alpn_task: Optional[asyncio.Task] = None
         
     async def initialize_session(self):
         """Initialize Selenium session and extract booking details"""
         self.logger.logger.info("Initializing Selenium session...")
+        self._loop = asyncio.get_running_loop()
         
         # Initialize Chrome driver with optimized options
         options = webdriver.ChromeOptions()
@@ -126,27 +347,58 @@ class BurstFireTeeTimeBooker:
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-logging")
         options.add_argument("--silent")
+        # Skip image downloads (and the visible window when headless); return once the DOM is ready
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.page_load_strategy = "eager"
         
-        self.driver = webdriver.Chrome(options=options)
+        # Selenium calls block, so run them on a worker thread to keep the event loop free
+        self.driver = await self._loop.run_in_executor(None, partial(webdriver.Chrome, options=options))
         
         try:
-            # Login and navigate to booking page
-            await self._login_and_navigate()
+            # Login, navigate to booking page, and extract cookies and booking URL for API calls
+            self.session_cookies, self.booking_url = await self._loop.run_in_executor(
+                None, self._sync_login_and_navigate
+            )
             
-            # Extract cookies and booking URL for API calls
-            self.session_cookies = self.driver.get_cookies()
-            self.booking_url = self._extract_booking_api_url()
+            # Build one long-lived HTTP session so every burst attempt and retry
+            # reuses pooled keep-alive connections instead of re-handshaking
+            cookie_dict = {cookie['name']: cookie['value'] for cookie in self.session_cookies}
+            # max_concurrent_requests caps the pool; attempts beyond it wait for a free connection
+            pool_size = self.config.max_concurrent_requests
+            connector = aiohttp.TCPConnector(
+                # IPv4 only: skips Happy Eyeballs IPv6/IPv4 racing on dual-stack hosts
+                family=socket.AF_INET,
+                limit=pool_size,
+                limit_per_host=pool_size,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                cookies=cookie_dict,
+                timeout=aiohttp.ClientTimeout(total=5)
+            )
             
             self.logger.logger.info("Session initialized successfully")
             
+            # Informational only, so it runs in the background instead of delaying the burst
+            self._alpn_task = self._loop.create_task(self._log_alpn())
+            
         except Exception as e:
             self.logger.logger.error(f"Failed to initialize session: {e}")
             if self.driver:
-                self.driver.quit()
+                await self._loop.run_in_executor(None, self.driver.quit)
             raise
     
-    async def _login_and_navigate(self):
-        """Handle login and navigation to booking page"""
+    def _sync_login_and_navigate(self) -> Tuple[List[Dict], str]:
+        """Handle login and navigation to booking page (blocking; runs in an executor)
+        
+        Returns the browser cookies and the booking API URL.
+        """
         self.driver.get("https://golf.com")
         
         # Wait for page load
@@ -164,47 +416,89 @@ class BurstFireTeeTimeBooker:
         sign_in_button = self.driver.find_element(By.NAME, "login_button")
         sign_in_button.click()
         
-        # Wait for login to complete
-        time.sleep(2)
+        # Wait for login to complete: the login form goes stale once the next page loads
+        try:
+            WebDriverWait(self.driver, 2).until(EC.staleness_of(sign_in_button))
+        except TimeoutException:
+            pass  # Same upper bound as the previous fixed 2s wait
         
-        # Navigate to booking section
+        # Navigate to booking section once the post-login DOM is parsed; the menu is
+        # optional, so only click it if it is present and visible
         try:
-            navbar_toggle = self.driver.find_element(By.CLASS_NAME, "navbar-toggle")
-            navbar_toggle.click()
-            self.driver.refresh()
+            WebDriverWait(self.driver, 2).until(
+                lambda driver: driver.execute_script("return document.readyState") != "loading"
+            )
+            navbar_toggles = self.driver.find_elements(By.CLASS_NAME, "navbar-toggle")
+            if navbar_toggles and navbar_toggles[0].is_displayed():
+                navbar_toggles[0].click()
+                self.driver.refresh()
         except Exception:
             pass  # Menu might not be needed on all sites
+        
+        return self.driver.get_cookies(), self._extract_booking_api_url()
     
     def _extract_booking_api_url(self) -> str:
         """Extract the actual booking API URL by analyzing network requests"""
         # This would normally require selenium-wire or monitoring network traffic
         # For now, we'll use a common booking endpoint pattern
-        current_url = self.driver.current_url
-        base_url = current_url.split('/')[0:3]  # protocol + domain
-        return f"{''.join(base_url)}/api/booking/book"
+        parts = urlsplit(self.driver.current_url)  # keep protocol + domain
+        return urlunsplit((parts.scheme, parts.netloc, "/api/booking/book", "", ""))
     
     async def execute_burst_strategy(self, target_date: str) -> List[BookingAttempt]:
         """Execute the burst-fire booking strategy"""
         self.logger.logger.info(f"Preparing burst strategy for {target_date}")
         
-        # Calculate precise timing
+        # Calculate precise timing, anchored once on the event loop's monotonic clock
+        loop = self._loop
         booking_time = self._calculate_booking_time()
+        base_ns = round((loop.time() + (booking_time - time.time())) * 1e9)
+        # Snapshot the offsets so prewarm, dispatch and the realtime window agree
+        offsets_ns = self.config.offsets_ns
+        
+        self._success_event = asyncio.Event()
         
-        # Prepare all booking requests
-        booking_tasks = []
-        for offset_ms in self.config.burst_offsets:
-            for tee_time in self.target_times:
-                task = self._schedule_booking_attempt(
-                    booking_time, offset_ms, target_date, tee_time
-                )
-                booking_tasks.append(task)
+        # Serialize every payload up front so the burst only sends bytes
+        for tee_time in self.target_times:
+            self._booking_payload(target_date, tee_time)
         
-        self.logger.logger.info(f"Scheduled {len(booking_tasks)} parallel booking attempts")
+        attempt_count = len(offsets_ns) * len(self.target_times)
+        
+        # Open one socket per attempt (up to the pool cap) ahead of the window so DNS
+        # and TLS handshakes happen outside the burst; never let it delay the first offset
+        prewarm_count = min(attempt_count, self.config.max_concurrent_requests)
+        prewarm_wait = base_ns / 1e9 - 1.5 - loop.time()
+        if prewarm_wait >= 0:
+            await asyncio.sleep(prewarm_wait)
+            first_offset_at = (base_ns + min(offsets_ns)) / 1e9
+            try:
+                await asyncio.wait_for(self._prewarm(prewarm_count),
+                                       timeout=first_offset_at - loop.time() - 0.1)
+            except asyncio.TimeoutError:
+                self.logger.logger.warning("Connection prewarm did not finish before the burst; continuing without it")
+        else:
+            self.logger.logger.warning("Booking window is less than 1.5s away; skipping connection prewarm")
         
         # Execute all requests in parallel
-        start_time = time.time()
+        with _realtime_window() as scheduling:
+            self.logger.logger.info(f"Burst scheduling: {scheduling}")
+            start_ns = time.monotonic_ns()
+            
+            # Explicit task handles (gather would wrap the coroutines the same way) so
+            # the realtime window below can wait on them before the full gather
+            booking_tasks = [
+                loop.create_task(self._schedule_booking_attempt(base_ns, offset_ns, target_date, tee_time))
+                for offset_ns in offsets_ns
+                for tee_time in self.target_times
+            ]
+            self.logger.logger.info(f"Scheduled {len(booking_tasks)} parallel booking attempts")
+            
+            # Leave the realtime window once the last offset has fired (plus a short
+            # grace for its request to go out); retries run at normal priority
+            last_offset_at = (base_ns + max(offsets_ns)) / 1e9
+            await asyncio.wait(booking_tasks, timeout=max(0.0, last_offset_at - loop.time()) + 0.05)
+        
         results = await asyncio.gather(*booking_tasks, return_exceptions=True)
-        total_time = (time.time() - start_time) * 1000
+        total_time = (time.monotonic_ns() - start_ns) / 1e6
         
         # Process results
         attempts = [r for r in results if isinstance(r, BookingAttempt)]
@@ -220,59 +514,64 @@ class BurstFireTeeTimeBooker:
     
     def _calculate_booking_time(self) -> float:
         """Calculate the exact timestamp for booking window"""
-        today = dt.now()
-        booking_time_parts = self.config.booking_window_time.split(':')
-        
-        booking_datetime = today.replace(
-            hour=int(booking_time_parts[0]),
-            minute=int(booking_time_parts[1]),
-            second=int(booking_time_parts[2]),
-            microsecond=0
-        )
-        
-        return booking_datetime.timestamp()
+        return dt.combine(date.today(), self.config.window_time).timestamp()
     
-    async def _schedule_booking_attempt(self, base_time: float, offset_ms: int, 
+    async def _schedule_booking_attempt(self, base_ns: int, offset_ns: int, 
                                       target_date: str, tee_time: str) -> BookingAttempt:
-        """Schedule and execute a single booking attempt"""
-        # Calculate exact execution time
-        execution_time = base_time + (offset_ms / 1000.0)
+        """Schedule and execute a single booking attempt
+        
+        base_ns is the booking window in event loop time (loop.time()) as integer
+        nanoseconds; offset_ns is this attempt's offset from it.
+        """
+        loop = self._loop
+        offset_ms = offset_ns // 1_000_000
         
-        # Wait until execution time
-        current_time = time.time()
-        wait_time = execution_time - current_time
+        # Calculate exact execution time on the loop's monotonic clock
+        execution_time = (base_ns + offset_ns) / 1e9
         
-        if wait_time > 0:
-            await asyncio.sleep(wait_time)
+        # Wait on a loop timer until execution time
+        if execution_time > loop.time():
+            fired = loop.create_future()
+            loop.call_at(execution_time, _resolve_future, fired)
+            await fired
         
         # Execute booking attempt
-        attempt_start = time.time()
+        attempt_start_ns = time.monotonic_ns()
         
         attempt = BookingAttempt(
-            timestamp=attempt_start,
+            timestamp=time.time(),
             offset_ms=offset_ms,
             response_time_ms=0.0
         )
         
+        # Another attempt already booked; don't send more requests
+        if self._success_event.is_set():
+            attempt.skipped = True
+            self.logger.log_attempt(attempt)
+            return attempt
+        
         try:
             # Perform the actual booking request
-            success, status_code, error_msg = await self._make_booking_request(target_date, tee_time)
+            success, status_code, error_body = await self._make_booking_request(target_date, tee_time)
             
-            response_time = (time.time() - attempt_start) * 1000
+            response_time = (time.monotonic_ns() - attempt_start_ns) / 1e6
             
             attempt.response_time_ms = response_time
-            attempt.status_code = status_code
-            attempt.success = success
-            attempt.error_message = error_msg
             attempt.round_trip_latency_ms = response_time  # Simplified for now
             
             # Implement smart retry logic for 400 errors
-            if status_code == 400 and "booking not open" in (error_msg or "").lower():
+            if status_code == 400 and error_body and _NOT_OPEN.search(error_body):
                 self.logger.logger.info(f"Received 400 'booking not open' at offset {offset_ms}ms, retrying...")
-                success, final_status, final_error = await self._smart_retry(target_date, tee_time, attempt_start)
-                attempt.success = success
-                attempt.status_code = final_status
-                attempt.error_message = final_error
+                success, status_code, error_body = await self._smart_retry(target_date, tee_time, attempt_start_ns)
+            
+            attempt.status_code = status_code
+            attempt.success = success
+            # A None status means the retry loop stood down after another attempt booked
+            attempt.skipped = status_code is None
+            if success:
+                self._success_event.set()
+            if error_body is not None:
+                attempt.error_message = error_body.decode("utf-8", errors="replace")
             
             self.logger.log_attempt(attempt)
             
@@ -282,68 +581,153 @@ class BurstFireTeeTimeBooker:
         
         return attempt
     
-    async def _make_booking_request(self, target_date: str, tee_time: str) -> Tuple[bool, int, Optional[str]]:
-        """Make the actual HTTP booking request"""
+    async def _prewarm(self, connection_count: int):
+        """Open parallel connections so the pool holds hot sockets for the burst"""
         
-        # Convert cookies to aiohttp format
-        cookie_dict = {}
-        if self.session_cookies:
-            for cookie in self.session_cookies:
-                cookie_dict[cookie['name']] = cookie['value']
+        async def warm_one():
+            async with self.session.head(self.booking_url, allow_redirects=False):
+                pass
         
-        # Prepare booking payload
-        booking_data = {
-            "date": target_date,
-            "time": tee_time,
-            "players": 1,
-            "course": "default"  # This would be configured based on actual site
-        }
+        results = await asyncio.gather(*[warm_one() for _ in range(connection_count)],
+                                       return_exceptions=True)
+        failures = [r for r in results if isinstance(r, Exception)]
         
-        async with aiohttp.ClientSession(cookies=cookie_dict) as session:
-            try:
-                async with session.post(
-                    self.booking_url,
-                    json=booking_data,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    
-                    response_text = await response.text()
+        if failures:
+            self.logger.logger.warning(f"Connection prewarm: {len(failures)}/{connection_count} failed ({failures[0]})")
+        else:
+            self.logger.logger.info(f"Prewarmed {connection_count} connections")
+    
+    async def _log_alpn(self):
+        """Log whether the booking host offers HTTP/2; the burst itself runs over HTTP/1.1"""
+        try:
+            protocol = await asyncio.wait_for(self._probe_alpn(), timeout=5)
+            self.logger.logger.info(f"Booking host ALPN selection: {protocol or 'none'} (client uses HTTP/1.1)")
+        except (OSError, asyncio.TimeoutError) as e:
+            self.logger.logger.warning(f"ALPN probe failed: {e}")
+    
+    async def _probe_alpn(self) -> Optional[str]:
+        """Return the protocol the booking host selects when offered h2 and http/1.1
+        
+        aiohttp itself only offers HTTP/1.1, so this separate TLS handshake is the
+        only way to see whether the server would accept HTTP/2.
+        """
+        parts = urlsplit(self.booking_url)
+        if parts.scheme != "https":
+            return None
+        
+        context = ssl.create_default_context()
+        context.set_alpn_protocols(["h2", "http/1.1"])
+        _, writer = await asyncio.open_connection(
+            parts.hostname, parts.port or 443, ssl=context, family=socket.AF_INET
+        )
+        try:
+            return writer.get_extra_info("ssl_object").selected_alpn_protocol()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+    
+    def _booking_payload(self, target_date: str, tee_time: str) -> bytes:
+        """Return the JSON-encoded booking payload, serializing it only once"""
+        key = (target_date, tee_time)
+        payload = self._payload_cache.get(key)
+        
+        if payload is None:
+            booking_data = {
+                "date": target_date,
+                "time": tee_time,
+                "players": 1,
+                "course": "default"  # This would be configured based on actual site
+            }
+            payload = _json_dumps(booking_data)
+            self._payload_cache[key] = payload
+        
+        return payload
+    
+    async def _make_booking_request(self, target_date: str, tee_time: str) -> Tuple[bool, int, Optional[bytes]]:
+        """Make the actual HTTP booking request, returning the raw error body on failure"""
+        
+        try:
+            async with self.session.post(
+                self.booking_url,
+                data=self._booking_payload(target_date, tee_time),
+                headers=self._json_headers
+            ) as response:
+                
+                body = await response.read()
+                
+                if response.status == 200:
+                    return True, response.status, None
+                else:
+                    return False, response.status, body
                     
-                    if response.status == 200:
-                        return True, response.status, None
-                    else:
-                        return False, response.status, response_text
-                        
-            except aiohttp.ClientError as e:
-                return False, 0, str(e)
+        except aiohttp.ClientError as e:
+            return False, 0, str(e).encode()
     
-    async def _smart_retry(self, target_date: str, tee_time: str, initial_start: float) -> Tuple[bool, int, Optional[str]]:
-        """Implement smart retry logic for 400 'booking not open' errors"""
+    async def _smart_retry(self, target_date: str, tee_time: str,
+                           initial_start_ns: int) -> Tuple[bool, Optional[int], Optional[bytes]]:
+        """Implement smart retry logic for 400 'booking not open' errors
+        
+        initial_start_ns is the time.monotonic_ns() reading of the first attempt.
+        Returns a None status when retrying stops because another attempt booked.
+        """
         
         retry_count = 0
-        cutoff_time = initial_start + self.config.cutoff_seconds
+        cutoff_ns = initial_start_ns + self.config.cutoff_seconds * 1_000_000_000
         
-        while retry_count < self.config.max_retry_attempts and time.time() < cutoff_time:
-            await asyncio.sleep(self.config.retry_interval_ms / 1000.0)
-            
-            success, status_code, error_msg = await self._make_booking_request(target_date, tee_time)
-            retry_count += 1
-            
-            # Success or different error - stop retrying
-            if success or status_code != 400:
-                return success, status_code, error_msg
-            
-            # Continue retrying if still getting 400 "booking not open"
-            if "booking not open" not in (error_msg or "").lower():
-                return success, status_code, error_msg
+        self._retry_waiters += 1
+        try:
+            while retry_count < self.config.max_retry_attempts and time.monotonic_ns() < cutoff_ns:
+                await self._wait_for_retry_tick()
+                
+                # Another attempt already booked; stop retrying
+                if self._success_event.is_set():
+                    return False, None, None
+                
+                success, status_code, error_body = await self._make_booking_request(target_date, tee_time)
+                retry_count += 1
+                
+                # Success or different error - stop retrying
+                if success or status_code != 400:
+                    return success, status_code, error_body
+                
+                # Continue retrying if still getting 400 "booking not open"
+                if not error_body or not _NOT_OPEN.search(error_body):
+                    return success, status_code, error_body
+        finally:
+            self._retry_waiters -= 1
+        
+        return False, 400, f"Max retries ({retry_count}) reached or cutoff time exceeded".encode()
+    
+    async def _wait_for_retry_tick(self):
+        """Block until the next shared retry tick, starting the ticker if needed"""
+        if self._tick_task is None or self._tick_task.done():
+            self._tick_task = self._loop.create_task(self._retry_ticker())
         
-        return False, 400, f"Max retries ({retry_count}) reached or cutoff time exceeded"
+        async with self._retry_tick:
+            await self._retry_tick.wait()
     
-    def cleanup(self):
+    async def _retry_ticker(self):
+        """Wake all waiting retriers every retry interval while any remain"""
+        interval = self.config.retry_interval_ms / 1000.0
+        
+        while self._retry_waiters:
+            await asyncio.sleep(interval)
+            async with self._retry_tick:
+                self._retry_tick.notify_all()
+    
+    async def cleanup(self):
         """Clean up resources"""
+        if self._tick_task and not self._tick_task.done():
+            self._tick_task.cancel()
+        if self._alpn_task and not self._alpn_task.done():
+            self._alpn_task.cancel()
+        if self.session:
+            await self.session.close()
+            self.session = None
         if self.driver:
-            self.driver.quit()
+            await self._loop.run_in_executor(None, self.driver.quit)
             self.driver = None
+        self.logger.close()
 
 
 async def run_burst_booking(config_file: str = "config.json"):
@@ -351,50 +735,23 @@ async def run_burst_booking(config_file: str = "config.json"):
     
     try:
         # Load configuration from file
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
-        
-        # Configuration
-        burst_cfg = config_data.get('burst_config', {})
-        config = BurstConfig(
-            burst_offsets=burst_cfg.get('burst_offsets', [-70, -40, -10, 10, 40, 70]),
-            retry_interval_ms=burst_cfg.get('retry_interval_ms', 35),
-            max_retry_attempts=burst_cfg.get('max_retry_attempts', 50),
-            booking_window_time=burst_cfg.get('booking_window_time', "23:00:00"),
-            cutoff_seconds=burst_cfg.get('cutoff_seconds', 30)
-        )
-        
-        # Credentials
-        credentials = config_data.get('credentials', {
-            "username": "USERNAME",
-            "password": "PASSWORD"
-        })
-        
-        # Target times
-        target_times = config_data.get('target_times', ["7:33", "7:42"])
-        
-        # Booking settings
-        booking_settings = config_data.get('booking_settings', {})
-        days_in_advance = booking_settings.get('days_in_advance', 2)
-        
+        app_config = AppConfig.load(config_file)
     except FileNotFoundError:
         print(f"Configuration file {config_file} not found. Using default settings.")
-        # Use default configuration
-        config = BurstConfig()
-        credentials = {"username": "USERNAME", "password": "PASSWORD"}
-        target_times = ["7:33", "7:42"]
-        days_in_advance = 2
+        app_config = AppConfig()
     except json.JSONDecodeError:
         print(f"Error parsing {config_file}. Using default settings.")
-        config = BurstConfig()
-        credentials = {"username": "USERNAME", "password": "PASSWORD"}
-        target_times = ["7:33", "7:42"]
-        days_in_advance = 2
+        app_config = AppConfig()
+    
+    config = app_config.burst_config
+    credentials = app_config.credentials
+    target_times = app_config.target_times
+    days_in_advance = app_config.days_in_advance
     
     # Calculate target booking date
     target_date = (date.today() + datetime.timedelta(days=days_in_advance)).strftime("%m-%d-%Y")
     
-    booker = BurstFireTeeTimeBooker(config, credentials, target_times)
+    booker = BurstFireTeeTimeBooker(config, credentials, target_times, app_config.headless)
     
     try:
         # Initialize session
@@ -419,13 +776,14 @@ async def run_burst_booking(config_file: str = "config.json"):
         booker.logger.logger.error(f"Fatal error during booking: {e}")
         raise
     finally:
-        booker.cleanup()
+        await booker.cleanup()
 
 def book_tee_time_automated(config_file: str = "config.json"):
     """Legacy function wrapper for backward compatibility"""
     booker = None
     try:
         # Run the async booking process
+        _install_fast_event_loop()
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         result = loop.run_until_complete(run_burst_booking(config_file))
@@ -435,23 +793,46 @@ def book_tee_time_automated(config_file: str = "config.json"):
         print(f"Booking failed: {e}")
         return None
 
-def schedule_burst_booking(config_file: str = "config.json"):
-    """Schedule the burst booking to run at the optimal time"""
+async def schedule_burst_booking(config_file: str = "config.json"):
+    """Run the burst booking daily at the configured time, just before the booking window opens"""
     
     try:
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
-        schedule_cfg = config_data.get('schedule', {})
-        run_time = schedule_cfg.get('run_time', "22:59:55")
-    except:
-        run_time = "22:59:55"
+        run_time = AppConfig.load(config_file).run_time
+    except Exception:
+        run_time = AppConfig().run_time
     
-    # Schedule to run just before the booking window opens
-    schedule.every().day.at(run_time).do(lambda: book_tee_time_automated(config_file))
+    # Accept "HH:MM:SS" or "HH:MM", as the previous schedule-based runner did
+    run_at = None
+    for time_format in ("%H:%M:%S", "%H:%M"):
+        try:
+            run_at = dt.strptime(run_time, time_format).time()
+            break
+        except ValueError:
+            continue
+    
+    if run_at is None:
+        print(f"Invalid schedule run_time {run_time!r}. Using default {AppConfig().run_time}.")
+        run_time = AppConfig().run_time
+        run_at = dt.strptime(run_time, "%H:%M:%S").time()
     
     print("Burst-fire tee time booking scheduled")
     print(f"Run time: {run_time} daily")
     print("Use --test to run immediately or check logs for results")
+    
+    while True:
+        # Next occurrence of run_time, today if it is still ahead
+        next_run = dt.combine(date.today(), run_at)
+        if next_run <= dt.now():
+            next_run += datetime.timedelta(days=1)
+        
+        # Sleep in bounded chunks so wall-clock changes (NTP, suspend) are re-checked
+        while (remaining := (next_run - dt.now()).total_seconds()) > 0:
+            await asyncio.sleep(min(remaining, 3600))
+        
+        try:
+            await run_burst_booking(config_file)
+        except Exception as e:
+            print(f"Booking failed: {e}")
 
 # Main execution
 if __name__ == "__main__":
@@ -464,17 +845,15 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    _install_fast_event_loop()
+    
     if args.test:
         print("Running test booking...")
         asyncio.run(run_burst_booking(args.config))
     else:
         # Default: run scheduled booking
-        schedule_burst_booking(args.config)
-        
         print("Scheduler started. Press Ctrl+C to exit.")
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
+            asyncio.run(schedule_burst_booking(args.config))
         except KeyboardInterrupt:
             print("\nScheduler stopped.")
\ No newline at end of file
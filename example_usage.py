@@ -4,30 +4,18 @@ Example usage of the Burst-Fire Tee Time Booking system
 """
 
 import asyncio
-import json
-from Automated_Tee_Time_Booking import BurstConfig, BurstFireTeeTimeBooker
+from Automated_Tee_Time_Booking import AppConfig, BurstFireTeeTimeBooker
 
 async def main():
     """Example of how to use the burst booking system"""
     
     # Load configuration from file
-    with open('config.json', 'r') as f:
-        config_data = json.load(f)
+    app_config = AppConfig.load('config.json')
     
-    # Create burst configuration
-    burst_cfg = config_data['burst_config']
-    config = BurstConfig(
-        burst_offsets=burst_cfg['burst_offsets'],
-        retry_interval_ms=burst_cfg['retry_interval_ms'],
-        max_retry_attempts=burst_cfg['max_retry_attempts'],
-        max_concurrent_requests=burst_cfg['max_concurrent_requests'],
-        booking_window_time=burst_cfg['booking_window_time'],
-        cutoff_seconds=burst_cfg['cutoff_seconds']
-    )
-    
-    # Setup credentials and targets
-    credentials = config_data['credentials']
-    target_times = config_data['target_times']
+    # Burst configuration, credentials and targets
+    config = app_config.burst_config
+    credentials = app_config.credentials
+    target_times = app_config.target_times
     
     print("Burst-Fire Tee Time Booking")
     print("=" * 40)
@@ -37,7 +25,7 @@ async def main():
     print(f"Retry interval: {config.retry_interval_ms}ms")
     
     # Create booker instance
-    booker = BurstFireTeeTimeBooker(config, credentials, target_times)
+    booker = BurstFireTeeTimeBooker(config, credentials, target_times, app_config.headless)
     
     try:
         print("\nInitializing session...")
@@ -58,7 +46,7 @@ async def main():
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        booker.cleanup()
+        await booker.cleanup()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
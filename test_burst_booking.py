@@ -9,24 +9,28 @@ import time
 from datetime import datetime
 import sys
 import os
+from types import SimpleNamespace
 
 # Add the current directory to path so we can import our module
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from Automated_Tee_Time_Booking import BurstConfig, BurstFireTeeTimeBooker, EnhancedLogger, BookingAttempt
+from Automated_Tee_Time_Booking import AppConfig, BurstConfig, BurstFireTeeTimeBooker, EnhancedLogger, BookingAttempt
 
 class MockBooker(BurstFireTeeTimeBooker):
     """Mock version of the booker for testing without actual web requests"""
     
     def __init__(self, config: BurstConfig):
-        self.config = config
-        self.logger = EnhancedLogger()
+        super().__init__(config, {"username": "test", "password": "test"}, ["7:33", "7:42"])
         self.mock_responses = {}
-        self.target_times = ["7:33", "7:42"]  # Add missing attribute
         
     async def initialize_session(self):
         """Mock session initialization"""
+        self._loop = asyncio.get_running_loop()
         self.logger.logger.info("Mock session initialized")
+    
+    async def _prewarm(self, connection_count: int):
+        """Mock connection prewarm (no network)"""
+        pass
         
     async def _make_booking_request(self, target_date: str, tee_time: str):
         """Mock booking request with simulated response times"""
@@ -37,15 +41,22 @@ class MockBooker(BurstFireTeeTimeBooker):
         current_ms = int(time.time() * 1000) % 1000
         
         if current_ms < 100:  # Early requests get 400
-            return False, 400, "booking not open yet"
+            return False, 400, b"booking not open yet"
         elif current_ms < 200:  # Some succeed
             return True, 200, None
         else:  # Later requests might fail due to capacity
-            return False, 409, "no availability"
+            return False, 409, b"no availability"
     
-    def cleanup(self):
-        """Mock cleanup"""
-        pass
+    async def cleanup(self):
+        """Mock cleanup: flush and stop this booker's log listener"""
+        self.logger.close()
+
+class AlwaysBookedMockBooker(MockBooker):
+    """Mock booker whose booking requests always succeed"""
+    
+    async def _make_booking_request(self, target_date: str, tee_time: str):
+        await asyncio.sleep(0.01)  # 10ms simulated latency
+        return True, 200, None
 
 async def test_timing_precision():
     """Test the timing precision of burst offsets"""
@@ -69,6 +80,7 @@ async def test_timing_precision():
     # Execute all timing offsets in parallel
     tasks = [timed_execution(offset) for offset in config.burst_offsets]
     results = await asyncio.gather(*tasks)
+    await booker.cleanup()
     
     # Analyze timing accuracy
     print(f"Base time: {base_time:.6f}")
@@ -83,17 +95,20 @@ async def test_parallel_execution():
     
     config = BurstConfig(burst_offsets=[-30, -10, 10, 30])
     booker = MockBooker(config)
+    await booker.initialize_session()
     
     # Test parallel booking attempts
     start_time = time.time()
+    base_ns = round(asyncio.get_running_loop().time() * 1e9) + 100_000_000
     
     tasks = []
-    for offset in config.burst_offsets:
+    for offset_ns in config.offsets_ns:
         for tee_time in ["7:33", "7:42"]:
-            task = booker._schedule_booking_attempt(start_time + 0.1, offset, "07-22-2025", tee_time)
+            task = booker._schedule_booking_attempt(base_ns, offset_ns, "07-22-2025", tee_time)
             tasks.append(task)
     
     attempts = await asyncio.gather(*tasks)
+    await booker.cleanup()
     
     total_time = (time.time() - start_time) * 1000
     print(f"Executed {len(attempts)} requests in {total_time:.2f}ms")
@@ -115,12 +130,14 @@ async def test_retry_logic():
     
     config = BurstConfig(retry_interval_ms=20, max_retry_attempts=5)
     booker = MockBooker(config)
+    await booker.initialize_session()
     
     # Simulate a retry scenario
-    start_time = time.time()
-    success, status_code, error_msg = await booker._smart_retry("07-22-2025", "7:33", start_time)
+    start_ns = time.monotonic_ns()
+    success, status_code, error_msg = await booker._smart_retry("07-22-2025", "7:33", start_ns)
     
-    retry_time = (time.time() - start_time) * 1000
+    retry_time = (time.monotonic_ns() - start_ns) / 1e6
+    await booker.cleanup()
     print(f"Retry logic completed in {retry_time:.2f}ms")
     print(f"Final result: Success={success}, Status={status_code}, Error={error_msg}")
 
@@ -136,6 +153,7 @@ async def test_burst_strategy():
     
     credentials = {"username": "test", "password": "test"}
     booker = MockBooker(config)
+    await booker.initialize_session()
     
     # Override the timing calculation to execute immediately
     original_calc = booker._calculate_booking_time
@@ -143,11 +161,80 @@ async def test_burst_strategy():
     
     # Execute a burst
     attempts = await booker.execute_burst_strategy("07-22-2025")
+    await booker.cleanup()
     
     # Summary
     successful = [a for a in attempts if a.success]
     print(f"Burst completed: {len(successful)}/{len(attempts)} successful")
 
+async def test_booking_url_extraction():
+    """Test the booking API URL is rebuilt from the browser's current URL"""
+    print("\n=== Testing Booking URL Extraction ===")
+    
+    booker = MockBooker(BurstConfig())
+    
+    cases = [
+        ("https://golf.com/members/home?tab=1#top", "https://golf.com/api/booking/book"),
+        ("https://golf.com:8443/", "https://golf.com:8443/api/booking/book"),
+    ]
+    for current_url, expected in cases:
+        booker.driver = SimpleNamespace(current_url=current_url)
+        booking_url = booker._extract_booking_api_url()
+        print(f"{current_url} -> {booking_url}")
+        assert booking_url == expected, f"expected {expected}, got {booking_url}"
+    
+    await booker.cleanup()
+
+async def test_app_config_loading():
+    """Test config defaults and which burst_config keys are honoured"""
+    print("\n=== Testing Configuration Loading ===")
+    
+    # Missing sections fall back to the field defaults
+    defaults = AppConfig.from_dict({})
+    assert defaults == AppConfig(), defaults
+    assert defaults.burst_config.burst_offsets == [-70, -40, -10, 10, 40, 70]
+    print(f"Defaults: offsets={defaults.burst_config.burst_offsets}, run_time={defaults.run_time}")
+    
+    # BurstConfig fields are passed through, unknown keys are dropped
+    app_config = AppConfig.from_dict({
+        "burst_config": {"burst_offsets": [-5, 5], "max_concurrent_requests": 4, "unknown_key": 1},
+        "target_times": ["8:00"],
+        "booking_settings": {"days_in_advance": 3, "headless": False},
+        "schedule": {"run_time": "21:59:55"}
+    })
+    assert app_config.burst_config.burst_offsets == [-5, 5]
+    assert app_config.burst_config.max_concurrent_requests == 4
+    assert app_config.burst_config.retry_interval_ms == BurstConfig().retry_interval_ms
+    assert app_config.target_times == ["8:00"]
+    assert app_config.days_in_advance == 3
+    assert app_config.headless is False
+    assert app_config.run_time == "21:59:55"
+    print(f"Loaded: {app_config}")
+
+async def test_stand_down_after_success():
+    """Test later attempts and retries stand down once one attempt books"""
+    print("\n=== Testing Stand-Down After Success ===")
+    
+    booker = AlwaysBookedMockBooker(BurstConfig(burst_offsets=[0, 50, 100], retry_interval_ms=20))
+    booker.target_times = ["7:33"]  # One attempt per offset keeps the first success deterministic
+    await booker.initialize_session()
+    booker._calculate_booking_time = lambda: time.time() + 0.1  # 100ms from now
+    
+    attempts = await booker.execute_burst_strategy("07-22-2025")
+    
+    # A retry loop started after the success stops without sending a request
+    success, status_code, error_body = await booker._smart_retry("07-22-2025", "7:33", time.monotonic_ns())
+    await booker.cleanup()
+    
+    first, later = attempts[0], attempts[1:]
+    assert first.success and not first.skipped and first.status_code == 200, first
+    for attempt in later:
+        assert attempt.skipped and not attempt.success and attempt.status_code is None, attempt
+    print(f"Booked at offset {first.offset_ms:+d}ms, {len(later)} attempts stood down")
+    
+    assert (success, status_code, error_body) == (False, None, None)
+    print(f"Retry after success: Success={success}, Status={status_code}")
+
 def run_all_tests():
     """Run all test functions"""
     print("Burst-Fire Tee Time Booking - Test Suite")
@@ -158,6 +245,9 @@ def run_all_tests():
         await test_parallel_execution() 
         await test_retry_logic()
         await test_burst_strategy()
+        await test_booking_url_extraction()
+        await test_app_config_loading()
+        await test_stand_down_after_success()
         print("\n=== All Tests Completed ===")
     
     # Run the tests